@@ -1,10 +1,18 @@
 # app.py
 import os
+import re
+import time
+import functools
+import threading
+import orjson
 from fastapi import FastAPI, File, UploadFile, Query, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 import logging
+import logging.handlers
+import queue
 
 # Import our new modules
 from schemas import AgentChatResponse, ErrorResponse
@@ -13,36 +21,100 @@ from services import stt, llm, tts
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Configure logging: records go onto a queue and are formatted/written by a background listener
+log_queue = queue.Queue(-1)
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+# The listener's handler does the real formatting; keep basicConfig from pre-formatting queued records
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+@app.on_event("startup")
+def start_log_listener():
+    """Starts draining queued log records in a background thread."""
+    log_listener.start()
+
+@app.on_event("shutdown")
+def stop_log_listener():
+    """Flushes any queued log records and stops the listener thread."""
+    log_listener.stop()
+
+@app.on_event("shutdown")
+def close_http_sessions():
+    """Closes pooled connections to upstream APIs."""
+    tts.http_session.close()
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Murf's voice catalog rarely changes, so keep the serialized /voices body for an hour
+VOICES_CACHE_TTL = 3600
+_voices_cache = {"timestamp": 0.0, "body": None}
+_voices_lock = threading.Lock()
+
+def _cached_voices_body():
+    """Returns the cached /voices JSON body, or None if it is missing or expired."""
+    if _voices_cache["body"] is not None and time.monotonic() - _voices_cache["timestamp"] < VOICES_CACHE_TTL:
+        return _voices_cache["body"]
+    return None
+
+# Utterances that carry no request for the agent; answering them costs a full LLM + TTS round trip
+FILLER_WORDS = {"uh", "um", "uhh", "umm", "hmm", "mm", "ah", "er", "okay", "ok"}
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+def normalize_text(text: str) -> str:
+    """Lowercases text and strips punctuation for comparisons."""
+    return _PUNCT_RE.sub('', text.strip().lower())
+
+def is_filler(text: str) -> bool:
+    """Returns True if the transcript contains only filler words or noise."""
+    words = normalize_text(text).split()
+    return not words or all(word in FILLER_WORDS for word in words)
+
+@functools.lru_cache(maxsize=4)
+def _load_template(path: str) -> str:
+    """Reads a template from disk once and keeps it in memory."""
+    with open(path, "r") as f:
+        return f.read()
+
 @app.get("/", response_class=HTMLResponse)
-def read_root():
+async def read_root():
     """Serves the main HTML page."""
-    with open("templates/index.html", "r") as f:
-        return f.read()
+    return HTMLResponse(content=_load_template("templates/index.html"))
 
 @app.get("/voices")
 def get_voices_endpoint():
     """Endpoint to get available voices and format them for the frontend."""
+    cached_body = _cached_voices_body()
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
     try:
-        murf_voices = tts.get_voices()
-        
-        formatted_voices = []
-        for voice in murf_voices:
-            voice_name = voice.get("name") or voice.get("voiceId")
-            formatted_voices.append({
-                "voice_id": voice.get("voiceId"),
-                "name": voice_name,
-                "labels": { "gender": voice.get("gender") }
-            })
+        # Only one request refreshes the cache; concurrent ones wait and reuse its result
+        with _voices_lock:
+            cached_body = _cached_voices_body()
+            if cached_body is not None:
+                return Response(content=cached_body, media_type="application/json")
+
+            murf_voices = tts.get_voices()
             
-        return {"voices": formatted_voices}
+            formatted_voices = []
+            for voice in murf_voices:
+                voice_name = voice.get("name") or voice.get("voiceId")
+                formatted_voices.append({
+                    "voice_id": voice.get("voiceId"),
+                    "name": voice_name,
+                    "labels": { "gender": voice.get("gender") }
+                })
+
+            body = orjson.dumps({"voices": formatted_voices})
+            _voices_cache["body"] = body
+            _voices_cache["timestamp"] = time.monotonic()
+            return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching and formatting voices: {e}")
         raise HTTPException(status_code=500, detail="Could not fetch voices.")
@@ -50,22 +122,26 @@ def get_voices_endpoint():
 @app.post("/agent/chat/{session_id}")
 async def agent_chat(session_id: str, audio_file: UploadFile = File(...), voice_id: str = Query(...)):
     """ Main conversational endpoint, refactored to use services. """
-    logger.info(f"Received chat request for session: {session_id}")
+    logger.info("Received chat request for session: %s", session_id)
     fallback_audio_url = f"/static/error.mp3"
     user_text = "I heard you, but an error occurred."
 
     try:
         # 1. Speech-to-Text
-        user_text = stt.transcribe_audio(audio_file)
+        # The STT and TTS clients are blocking, so run them off the event loop
+        user_text = await run_in_threadpool(stt.transcribe_audio, audio_file)
         if not user_text:
             logger.info("User was silent.")
-            return JSONResponse(status_code=200, content={"user_transcription": "[silence]", "ai_response_audio_url": None})
+            return ORJSONResponse(status_code=200, content={"user_transcription": "[silence]", "ai_response_audio_url": None})
+        if is_filler(user_text):
+            logger.info("Ignoring filler utterance: '%s'", user_text)
+            return ORJSONResponse(status_code=200, content={"user_transcription": user_text, "ai_response_audio_url": None})
 
         # 2. Language Model
-        llm_response_text = llm.get_llm_response(session_id, user_text)
+        llm_response_text = await llm.get_llm_response(session_id, user_text)
 
         # 3. Text-to-Speech
-        audio_url = tts.generate_speech_audio(llm_response_text, voice_id, session_id)
+        audio_url = await run_in_threadpool(tts.generate_speech_audio, llm_response_text, voice_id)
 
         return AgentChatResponse(
             user_transcription=user_text,
@@ -80,4 +156,12 @@ async def agent_chat(session_id: str, audio_file: UploadFile = File(...), voice_
             ai_response_audio_url=fallback_audio_url,
             error=str(e)
         )
-        return JSONResponse(status_code=500, content=error_response.dict())
+        return ORJSONResponse(status_code=500, content=error_response.dict())
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" picks uvloop and httptools when they are installed (uvloop is not available on Windows).
+    # Chat sessions and the voices cache live in process memory, so this must stay a single worker
+    # until that state is moved to a shared store.
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="auto", http="auto")
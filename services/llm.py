@@ -1,5 +1,7 @@
 # services/llm.py
 import os
+import functools
+from collections import OrderedDict
 import google.generativeai as genai
 import logging
 
@@ -7,30 +9,50 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# In-memory datastore for chat history
-chat_histories = {}
+# In-memory datastore of live chat sessions, evicting the least recently used
+MAX_CHAT_SESSIONS = 1000
+chat_sessions = OrderedDict()
 
-def get_llm_response(session_id: str, user_text: str) -> str:
-    """
-    Gets a response from the Google Gemini LLM.
-    """
+# Only the most recent messages are resent to Gemini; must be even so history starts on a user turn
+MAX_HISTORY_MESSAGES = 20
+
+def _get_chat_session(session_id: str, model: genai.GenerativeModel) -> genai.ChatSession:
+    """Returns the chat session for session_id, creating it if needed."""
+    chat = chat_sessions.get(session_id)
+    if chat is None:
+        chat = model.start_chat(history=[])
+        chat_sessions[session_id] = chat
+        if len(chat_sessions) > MAX_CHAT_SESSIONS:
+            evicted_id, _ = chat_sessions.popitem(last=False)
+            logger.info("Evicted chat session %s", evicted_id)
+    else:
+        chat_sessions.move_to_end(session_id)
+    return chat
+
+@functools.lru_cache(maxsize=1)
+def _get_model() -> genai.GenerativeModel:
+    """Configures the Gemini SDK once and returns a shared model."""
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         logger.error("Gemini API key not found.")
         raise ValueError("Gemini API key not found.")
     
     genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-1.5-flash')
-    
-    if session_id not in chat_histories:
-        chat_histories[session_id] = []
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+async def get_llm_response(session_id: str, user_text: str) -> str:
+    """
+    Gets a response from the Google Gemini LLM without blocking the event loop.
+    """
+    model = _get_model()
     
-    logger.info(f"Getting LLM response for session {session_id}...")
-    chat = model.start_chat(history=chat_histories[session_id])
-    llm_response = chat.send_message(user_text)
+    logger.info("Getting LLM response for session %s...", session_id)
+    chat = _get_chat_session(session_id, model)
+    if len(chat.history) > MAX_HISTORY_MESSAGES:
+        chat.history = chat.history[-MAX_HISTORY_MESSAGES:]
+    llm_response = await chat.send_message_async(user_text)
     llm_response_text = llm_response.text
     
-    chat_histories[session_id] = chat.history
-    
-    logger.info(f"LLM response received: '{llm_response_text}'")
+    logger.info("LLM response received (%d chars).", len(llm_response_text))
+    logger.debug("LLM response text: '%s'", llm_response_text)
     return llm_response_text
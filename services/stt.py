@@ -1,5 +1,6 @@
 # services/stt.py
 import os
+import functools
 import assemblyai
 from fastapi import UploadFile
 import logging
@@ -8,19 +9,24 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def transcribe_audio(audio_file: UploadFile) -> str:
-    """
-    Transcribes audio using the AssemblyAI API.
-    """
+@functools.lru_cache(maxsize=1)
+def _get_transcriber() -> assemblyai.Transcriber:
+    """Configures AssemblyAI once and returns a shared Transcriber."""
     api_key = os.getenv("ASSEMBLYAI_API_KEY")
     if not api_key:
         logger.error("AssemblyAI API key not found.")
         raise ValueError("AssemblyAI API key not found.")
     
     assemblyai.settings.api_key = api_key
+    return assemblyai.Transcriber()
+
+def transcribe_audio(audio_file: UploadFile) -> str:
+    """
+    Transcribes audio using the AssemblyAI API.
+    """
+    transcriber = _get_transcriber()
     
     logger.info("Starting transcription...")
-    transcriber = assemblyai.Transcriber()
     transcript = transcriber.transcribe(audio_file.file)
 
     if transcript.status == assemblyai.TranscriptStatus.error:
@@ -28,5 +34,6 @@ def transcribe_audio(audio_file: UploadFile) -> str:
         raise Exception(f"STT Error: {transcript.error}")
     
     user_text = transcript.text
-    logger.info(f"Transcription successful. Text: '{user_text}'")
+    logger.info("Transcription successful.")
+    logger.debug("Transcribed text: '%s'", user_text)
     return user_text
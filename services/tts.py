@@ -1,53 +1,55 @@
 # services/tts.py
 import os
+import functools
+import orjson
 import requests
-import time
+from requests.adapters import HTTPAdapter
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_voices() -> list:
-    """Fetches the list of available voices from the Murf AI API."""
+# Shared session so Murf requests reuse keep-alive connections instead of a new TLS handshake each turn
+http_session = requests.Session()
+# TTS calls run in FastAPI's threadpool, so allow enough pooled connections for concurrent turns
+http_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+MURF_VOICES_URL = "https://api.murf.ai/v1/speech/voices"
+MURF_GENERATE_URL = "https://api.murf.ai/v1/speech/generate"
+
+@functools.lru_cache(maxsize=1)
+def _get_headers() -> dict:
+    """Reads and validates the Murf API key once and returns the auth headers."""
     api_key = os.getenv("MURF_API_KEY")
     if not api_key:
         logger.error("MURF_API_KEY not found in environment variables.")
         raise ValueError("MURF_API_KEY not found.")
     
-    api_key = api_key.strip()
-    
-    url = "https://api.murf.ai/v1/speech/voices"
-    headers = {"api-key": api_key}
+    return {"api-key": api_key.strip()}
+
+def get_voices() -> list:
+    """Fetches the list of available voices from the Murf AI API."""
+    headers = _get_headers()
     
     logger.info("Fetching voices from Murf AI...")
     try:
-        response = requests.get(url, headers=headers)
+        response = http_session.get(MURF_VOICES_URL, headers=headers)
         response.raise_for_status()
         
-        voices = response.json()
-        logger.info(f"Successfully fetched {len(voices)} voices from Murf AI.")
+        voices = orjson.loads(response.content)
+        logger.info("Successfully fetched %d voices from Murf AI.", len(voices))
         return voices
     except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching voices: {e}")
         raise
 
-def generate_speech_audio(text: str, voice_id: str, session_id: str) -> str:
+def generate_speech_audio(text: str, voice_id: str) -> str:
     """
-    Generates speech audio using the Murf AI API.
+    Generates speech audio using the Murf AI API and returns the URL of the
+    Murf-hosted audio file, which the browser plays directly.
     """
-    api_key = os.getenv("MURF_API_KEY")
-    if not api_key:
-        logger.error("MURF_API_KEY not found in environment variables.")
-        raise ValueError("MURF_API_KEY not found.")
-    
-    api_key = api_key.strip()
-    
-    generate_url = "https://api.murf.ai/v1/speech/generate" 
-    headers = {
-        "Content-Type": "application/json",
-        "api-key": api_key
-    }
+    headers = _get_headers()
     
     payload = {
         "voiceId": voice_id,
@@ -57,10 +59,11 @@ def generate_speech_audio(text: str, voice_id: str, session_id: str) -> str:
         "modelVersion": "GEN2"
     }
     
-    logger.info(f"Requesting speech generation from Murf AI...")
+    logger.info("Requesting speech generation from Murf AI...")
     
     try:
-        response = requests.post(generate_url, json=payload, headers=headers)
+        # requests sets Content-Type: application/json for json= bodies
+        response = http_session.post(MURF_GENERATE_URL, json=payload, headers=headers)
         response.raise_for_status()
         response_data = response.json()
 
@@ -69,19 +72,8 @@ def generate_speech_audio(text: str, voice_id: str, session_id: str) -> str:
         if not audio_url_from_api:
             raise Exception("Failed to get audio URL from Murf AI.")
 
-        logger.info(f"Downloading generated audio from {audio_url_from_api}")
-        audio_response = requests.get(audio_url_from_api)
-        audio_response.raise_for_status()
-
-        audio_filename = f"response_{session_id}.mp3"
-        audio_filepath = os.path.join("static", audio_filename)
-        
-        with open(audio_filepath, "wb") as f:
-            f.write(audio_response.content)
-        
-        final_audio_url = f"/static/{audio_filename}?v={time.time()}"
-        logger.info(f"Speech audio successfully saved to {final_audio_url}")
-        return final_audio_url
+        logger.info("Speech audio generated at %s", audio_url_from_api)
+        return audio_url_from_api
         
     except requests.exceptions.HTTPError as e:
         logger.error(f"HTTP Error: {e}")